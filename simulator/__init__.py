@@ -0,0 +1,10 @@
+"""
+Local simulators for offline load testing of the IoT CCTV server.
+
+Provides a fake ESP32-CAM, a fake Telegram Bot API and a load generator that
+drives simulated cameras against the Flask app. See `python -m simulator -h`.
+"""
+from simulator.esp32cam import create_esp32cam_app
+from simulator.telegram import create_telegram_app
+from simulator.server import start_server
+from simulator.loadgen import run_load_test, print_report
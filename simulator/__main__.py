@@ -0,0 +1,168 @@
+"""
+Command line entry point for the offline simulators
+
+Examples:
+    python -m simulator camera --count 4 --port 8100
+    python -m simulator telegram --port 8200 --failure-rate 0.1
+    python -m simulator loadtest --target http://127.0.0.1:5000 --cameras 1,2,4,8 --duration 30
+
+Start the Flask server with ESP32_CAM_URL pointing at a simulated camera and
+TELEGRAM_API_URL pointing at the Telegram stand-in so nothing reaches real devices.
+"""
+import argparse
+import logging
+import time
+from simulator.esp32cam import create_esp32cam_app
+from simulator.telegram import create_telegram_app
+from simulator.server import start_server
+from simulator.loadgen import run_load_test, print_report
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler()]
+)
+logging.getLogger('werkzeug').setLevel(logging.WARNING)
+logger = logging.getLogger('simulator')
+
+# Keeps the Telegram stand-in's random stream apart from the cameras'
+TELEGRAM_SEED_OFFSET = 10000
+
+def positive_int(value):
+    """argparse type for integers greater than zero"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {value}")
+    return number
+
+def instance_seed(seed, offset):
+    """Derive an independent seed for one simulated instance, None stays unseeded"""
+    return None if seed is None else seed + offset
+
+def add_fault_arguments(parser):
+    parser.add_argument('--latency', type=float, default=0.0, help='Base response delay in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Maximum extra random delay in seconds')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Probability (0-1) of an error response')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible runs')
+
+def start_cameras(args, count, port):
+    """Start `count` simulated cameras on consecutive ports, 0 picks free ports"""
+    urls = []
+    for camera_id in range(count):
+        app = create_esp32cam_app(camera_id, args.latency, args.jitter, args.failure_rate,
+                                  args.image, args.fps, instance_seed(args.seed, camera_id))
+        server = start_server(app, args.host, port + camera_id if port else 0)
+        urls.append(f"http://{args.host}:{server.server_port}")
+        if getattr(args, 'stream_port', None):
+            # The real firmware serves /stream on a separate port (81)
+            start_server(app, args.host, args.stream_port + camera_id)
+    return urls
+
+def serve_forever():
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        logger.info("Shutting down simulators")
+
+def run_camera(args):
+    urls = start_cameras(args, args.count, args.port)
+    for url in urls:
+        logger.info(f"Simulated ESP32-CAM ready: {url}")
+    logger.info(f"Start the server with ESP32_CAM_URL={urls[0]}")
+    serve_forever()
+
+def run_telegram(args):
+    app = create_telegram_app(args.latency, args.jitter, args.failure_rate,
+                              instance_seed(args.seed, TELEGRAM_SEED_OFFSET))
+    server = start_server(app, args.host, args.port)
+    logger.info(f"Telegram stand-in ready, set TELEGRAM_API_URL=http://{args.host}:{server.server_port}")
+    serve_forever()
+
+def run_loadtest(args):
+    try:
+        camera_counts = sorted({int(count) for count in args.cameras.split(',')})
+    except ValueError:
+        raise SystemExit(f"Invalid --cameras value: {args.cameras}")
+    if not camera_counts or camera_counts[0] < 1:
+        raise SystemExit("--cameras must contain positive integers")
+
+    telegram_app = None
+    if args.telegram_port is not None:
+        telegram_app = create_telegram_app(args.telegram_latency, args.telegram_jitter,
+                                           args.telegram_failure_rate,
+                                           instance_seed(args.seed, TELEGRAM_SEED_OFFSET))
+        server = start_server(telegram_app, args.host, args.telegram_port)
+        logger.info(f"Telegram stand-in ready, set TELEGRAM_API_URL=http://{args.host}:{server.server_port}")
+
+    camera_urls = start_cameras(args, camera_counts[-1], args.camera_port)
+    logger.info(f"Started {len(camera_urls)} simulated cameras, first at {camera_urls[0]}")
+    # /api/status polls whatever ESP32_CAM_URL names, so it must be the simulated camera 0
+    logger.info(f"The server must run with ESP32_CAM_URL={camera_urls[0]}")
+
+    report = run_load_test(args.target, camera_urls, camera_counts, args.duration, args.timeout,
+                           args.status_interval, args.think_time)
+    if telegram_app is not None:
+        stats = telegram_app.config['TELEGRAM_STATS']
+        report['telegram'] = {
+            'messages': len(telegram_app.config['TELEGRAM_MESSAGES']),
+            'requests': stats['requests'],
+            'failures': stats['failures']
+        }
+    print_report(report, args.json)
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m simulator',
+                                     description='Offline ESP32-CAM / Telegram simulators and load generator')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    camera = subparsers.add_parser('camera', help='Run simulated ESP32-CAM devices')
+    camera.add_argument('--host', default='127.0.0.1')
+    camera.add_argument('--port', type=int, default=8100, help='Port of the first camera')
+    camera.add_argument('--stream-port', type=int, default=None,
+                        help='Also serve each camera on this port + camera id, like the firmware :81 stream')
+    camera.add_argument('--count', type=positive_int, default=1)
+    camera.add_argument('--image', default=None, help='JPEG to serve instead of synthetic frames')
+    camera.add_argument('--fps', type=positive_int, default=10, help='MJPEG stream frame rate')
+    add_fault_arguments(camera)
+    camera.set_defaults(func=run_camera)
+
+    telegram = subparsers.add_parser('telegram', help='Run the Telegram Bot API stand-in')
+    telegram.add_argument('--host', default='127.0.0.1')
+    telegram.add_argument('--port', type=int, default=8200)
+    add_fault_arguments(telegram)
+    telegram.set_defaults(func=run_telegram)
+
+    loadtest = subparsers.add_parser('loadtest', help='Drive simulated cameras against the Flask server')
+    loadtest.add_argument('--target', default='http://127.0.0.1:5000', help='Base URL of the Flask server')
+    loadtest.add_argument('--cameras', default='1,2,4,8', help='Comma-separated camera counts, one stage each')
+    loadtest.add_argument('--duration', type=float, default=30, help='Seconds per stage')
+    loadtest.add_argument('--timeout', type=float, default=30, help='Per-request timeout in seconds')
+    loadtest.add_argument('--status-interval', type=float, default=None,
+                          help='Seconds between /api/status polls per camera (default: disabled)')
+    loadtest.add_argument('--think-time', type=float, default=0.0, help='Pause between capture cycles')
+    loadtest.add_argument('--host', default='127.0.0.1', help='Interface for the simulated services')
+    loadtest.add_argument('--camera-port', type=int, default=8100,
+                          help='Port of the first camera, must match the server ESP32_CAM_URL (0 picks free ports)')
+    loadtest.add_argument('--telegram-port', type=int, default=None,
+                          help='Also run the Telegram stand-in on this port and report what it received')
+    loadtest.add_argument('--telegram-latency', type=float, default=0.0,
+                          help='Base Telegram stand-in response delay in seconds')
+    loadtest.add_argument('--telegram-jitter', type=float, default=0.0,
+                          help='Maximum extra random Telegram stand-in delay in seconds')
+    loadtest.add_argument('--telegram-failure-rate', type=float, default=0.0,
+                          help='Probability (0-1) of a Telegram 429 response')
+    loadtest.add_argument('--image', default=None, help='JPEG to serve instead of synthetic frames')
+    loadtest.add_argument('--fps', type=positive_int, default=10, help='MJPEG stream frame rate')
+    loadtest.add_argument('--json', default=None, help='Also write the report to this JSON file')
+    add_fault_arguments(loadtest)
+    loadtest.set_defaults(func=run_loadtest)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+import time
+import threading
+import logging
+import cv2
+import numpy as np
+from flask import Flask, request, jsonify, Response
+from simulator.server import FaultProfile
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+FRAME_SIZE = (640, 480)
+FRAME_COUNT = 10
+MOTION_HOLD_SECONDS = 2.0
+
+def generate_frames(camera_id=0, image_path=None, count=FRAME_COUNT):
+    """
+    Build the JPEG frames served by a simulated camera
+
+    Args:
+        camera_id: Camera number drawn on the synthetic frames
+        image_path: Optional path to a real image (e.g. with faces) to serve instead
+        count: Number of synthetic frames to cycle through
+
+    Returns:
+        list: JPEG-encoded frames as bytes
+    """
+    if image_path:
+        with open(image_path, 'rb') as f:
+            return [f.read()]
+
+    width, height = FRAME_SIZE
+    frames = []
+    gradient = np.tile(np.linspace(40, 200, width, dtype=np.uint8), (height, 1))
+    for i in range(count):
+        frame = cv2.merge([gradient, np.roll(gradient, i * 16, axis=1), gradient[::-1]])
+        x = (i * width // count) % (width - 80)
+        cv2.rectangle(frame, (x, height // 3), (x + 80, height // 3 + 100), (255, 255, 255), -1)
+        cv2.putText(frame, f"SIM CAM {camera_id} #{i}", (10, 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
+        ok, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+        if ok:
+            frames.append(buffer.tobytes())
+    return frames
+
+def create_esp32cam_app(camera_id=0, latency=0.0, jitter=0.0, failure_rate=0.0,
+                        image_path=None, fps=10, seed=None):
+    """
+    Create a Flask app that mimics the ESP32-CAM firmware
+
+    Serves `/` (JSON status), `/capture` (JPEG), `/control?cmd=...` and `/stream`
+    (MJPEG). Every request is delayed by `latency` plus up to `jitter` seconds and
+    fails with HTTP 503 with probability `failure_rate`.
+
+    Args:
+        camera_id: Identifier reported in the status payload
+        latency: Base response delay in seconds
+        jitter: Maximum extra random delay in seconds
+        failure_rate: Probability (0-1) that a request returns 503
+        image_path: Optional JPEG to serve instead of synthetic frames
+        fps: Frame rate of the MJPEG stream, must be greater than 0
+        seed: Optional random seed for reproducible runs
+
+    Returns:
+        Flask: The simulated camera application
+    """
+    if fps <= 0:
+        raise ValueError(f"fps must be greater than 0, got {fps}")
+
+    app = Flask(__name__)
+    faults = FaultProfile(latency, jitter, failure_rate, seed)
+    frames = generate_frames(camera_id, image_path)
+    lock = threading.Lock()
+    state = {
+        'motion_until': 0.0,
+        'motion_count': 0,
+        'buzzer_until': 0.0,
+        'flash': False,
+        'active_streams': 0,
+        'stream_generation': 0,
+        'frame_index': 0,
+        'requests': 0,
+        'failures': 0
+    }
+    app.config['CAMERA_STATE'] = state
+    app.config['FAULTS'] = faults
+
+    def next_frame():
+        with lock:
+            frame = frames[state['frame_index'] % len(frames)]
+            state['frame_index'] += 1
+        return frame
+
+    @app.before_request
+    def inject_faults():
+        """Apply the configured latency and failure rate to every request"""
+        faults.delay()
+        with lock:
+            state['requests'] += 1
+        if faults.should_fail():
+            with lock:
+                state['failures'] += 1
+            logger.debug(f"Simulated failure on camera {camera_id}: {request.path}")
+            return Response("Service Unavailable", status=503, mimetype='text/plain')
+
+    @app.route('/')
+    def status():
+        """Return the status payload polled by /api/status"""
+        with lock:
+            return jsonify({
+                'status': 'Online',
+                'camera_id': camera_id,
+                'motion': time.time() < state['motion_until'],
+                'buzzer': time.time() < state['buzzer_until'],
+                'pir_connected': True,
+                'motion_count': state['motion_count'],
+                'flash': state['flash'],
+                'streaming': state['active_streams'] > 0
+            })
+
+    @app.route('/capture')
+    def capture():
+        """Return a single JPEG frame and register a PIR motion event"""
+        with lock:
+            state['motion_until'] = time.time() + MOTION_HOLD_SECONDS
+            state['motion_count'] += 1
+        return Response(next_frame(), mimetype='image/jpeg')
+
+    @app.route('/control')
+    def control():
+        """Handle buzzer, flash and stream commands"""
+        cmd = request.args.get('cmd', '')
+        with lock:
+            if cmd == 'buzzer':
+                duration = request.args.get('duration', default=1000, type=int)
+                state['buzzer_until'] = time.time() + duration / 1000.0
+            elif cmd == 'flash':
+                state['flash'] = not state['flash']
+            elif cmd == 'stopstream':
+                # Ends the streams open now; streams started afterwards keep running
+                state['stream_generation'] += 1
+            else:
+                return Response("Unknown command", status=400, mimetype='text/plain')
+        return Response("OK", mimetype='text/plain')
+
+    @app.route('/stream')
+    def stream():
+        """Serve an MJPEG stream until /control?cmd=stopstream or the client disconnects"""
+        with lock:
+            generation = state['stream_generation']
+
+        def generate():
+            interval = 1.0 / fps
+            # Counted inside the generator so the finally below always balances it
+            with lock:
+                state['active_streams'] += 1
+            try:
+                while True:
+                    with lock:
+                        if state['stream_generation'] != generation:
+                            break
+                    frame = next_frame()
+                    yield (b"--frame\r\nContent-Type: image/jpeg\r\n"
+                           b"Content-Length: " + str(len(frame)).encode() + b"\r\n\r\n" + frame + b"\r\n")
+                    time.sleep(interval)
+            finally:
+                with lock:
+                    state['active_streams'] -= 1
+
+        return Response(generate(), mimetype='multipart/x-mixed-replace; boundary=frame')
+
+    return app
@@ -0,0 +1,210 @@
+import math
+import time
+import json
+import threading
+import logging
+import requests
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+SATURATION_GAIN = 1.1
+CAPTURE_RETRY_DELAY = 0.5
+
+class LatencyRecorder:
+    """Thread-safe collector of per-endpoint request outcomes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def record(self, endpoint, latency, error=None):
+        with self._lock:
+            self._samples.setdefault(endpoint, []).append((latency, error))
+
+    def summary(self, elapsed):
+        """
+        Return throughput, latency percentiles and error rates per endpoint
+
+        Percentiles and max_ms cover successful requests only, so timeouts do not
+        inflate the tail; the slowest failure is reported as error_max_ms.
+        """
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+
+        summary = {}
+        for name, values in samples.items():
+            latencies = sorted(latency for latency, error in values if not error)
+            error_latencies = [latency for latency, error in values if error]
+            errors = {}
+            for _, error in values:
+                if error:
+                    errors[error] = errors.get(error, 0) + 1
+            error_count = sum(errors.values())
+            summary[name] = {
+                'requests': len(values),
+                'errors': error_count,
+                'error_rate': round(error_count / len(values), 4) if values else 0.0,
+                'throughput_rps': round(len(latencies) / elapsed, 3) if elapsed > 0 else 0.0,
+                'p50_ms': percentile(latencies, 50),
+                'p95_ms': percentile(latencies, 95),
+                'p99_ms': percentile(latencies, 99),
+                'max_ms': round(latencies[-1] * 1000, 1) if latencies else 0.0,
+                'error_max_ms': round(max(error_latencies) * 1000, 1) if error_latencies else 0.0,
+                'error_breakdown': errors
+            }
+        return summary
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list of seconds, in milliseconds"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return round(sorted_values[min(rank, len(sorted_values)) - 1] * 1000, 1)
+
+def timed_request(session, recorder, endpoint, method, url, **kwargs):
+    """Issue an HTTP request, record its latency and outcome, and return the response or None"""
+    start = time.perf_counter()
+    try:
+        response = session.request(method, url, **kwargs)
+        latency = time.perf_counter() - start
+        if response.status_code >= 400:
+            recorder.record(endpoint, latency, f"HTTP {response.status_code}")
+            return None
+        recorder.record(endpoint, latency)
+        return response
+    except requests.exceptions.Timeout:
+        recorder.record(endpoint, time.perf_counter() - start, 'Timeout')
+    except requests.exceptions.ConnectionError:
+        recorder.record(endpoint, time.perf_counter() - start, 'ConnectionError')
+    except requests.exceptions.RequestException as e:
+        recorder.record(endpoint, time.perf_counter() - start, type(e).__name__)
+    return None
+
+def camera_worker(recorder, target_url, camera_url, deadline, timeout, status_interval, think_time,
+                  retry_delay=CAPTURE_RETRY_DELAY):
+    """Emulate one dashboard: capture from the camera, post to process_image, poll status"""
+    session = requests.Session()
+    last_status = 0.0
+    while time.time() < deadline:
+        capture = timed_request(session, recorder, 'camera_capture', 'GET', f"{camera_url}/capture",
+                                timeout=timeout)
+        if capture is not None:
+            timed_request(session, recorder, 'process_image', 'POST', f"{target_url}/api/process_image",
+                          files={'image': ('capture.jpg', capture.content, 'image/jpeg')},
+                          timeout=timeout)
+
+        if status_interval and time.time() - last_status >= status_interval:
+            last_status = time.time()
+            timed_request(session, recorder, 'status', 'GET', f"{target_url}/api/status", timeout=timeout)
+
+        # Back off after a failed capture so a refused or 503 camera is not hammered
+        pause = think_time if capture is not None else max(think_time, retry_delay)
+        if pause > 0:
+            time.sleep(min(pause, max(0.0, deadline - time.time())))
+    session.close()
+
+def run_stage(target_url, camera_urls, duration, timeout=30, status_interval=None, think_time=0.0):
+    """
+    Drive one simulated dashboard per camera against the server for a fixed duration
+
+    Args:
+        target_url: Base URL of the Flask server under test
+        camera_urls: Base URLs of the (simulated) cameras to capture from
+        duration: Stage length in seconds
+        timeout: Per-request timeout in seconds
+        status_interval: Seconds between /api/status polls per worker, None to disable
+        think_time: Pause in seconds between capture cycles
+
+    Returns:
+        dict: Stage report with per-endpoint statistics
+    """
+    recorder = LatencyRecorder()
+    start = time.time()
+    deadline = start + duration
+    threads = []
+    for camera_url in camera_urls:
+        thread = threading.Thread(
+            target=camera_worker,
+            args=(recorder, target_url, camera_url, deadline, timeout, status_interval, think_time),
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+    return {
+        'cameras': len(camera_urls),
+        'duration_s': round(elapsed, 2),
+        'endpoints': recorder.summary(elapsed)
+    }
+
+def find_saturation(stages, endpoint='process_image'):
+    """Return the camera count after which throughput stops growing, or None"""
+    previous = None
+    for stage in stages:
+        current = stage['endpoints'].get(endpoint, {}).get('throughput_rps', 0.0)
+        if previous is not None and current < previous[1] * SATURATION_GAIN:
+            return previous[0]
+        previous = (stage['cameras'], current)
+    return None
+
+def run_load_test(target_url, camera_urls, camera_counts, duration, timeout=30,
+                  status_interval=None, think_time=0.0):
+    """
+    Run a stepped load test, one stage per camera count
+
+    Args:
+        target_url: Base URL of the Flask server under test
+        camera_urls: Base URLs of all available cameras
+        camera_counts: Number of cameras to use in each stage, e.g. [1, 2, 4, 8]
+        duration: Length of each stage in seconds
+        timeout: Per-request timeout in seconds
+        status_interval: Seconds between /api/status polls per worker, None to disable
+        think_time: Pause in seconds between capture cycles
+
+    Returns:
+        dict: Report with all stages and the detected saturation point
+    """
+    target_url = target_url.rstrip('/')
+    stages = []
+    for count in camera_counts:
+        logger.info(f"Running stage with {count} cameras for {duration}s")
+        stage = run_stage(target_url, camera_urls[:count], duration, timeout, status_interval, think_time)
+        stages.append(stage)
+    return {
+        'target': target_url,
+        'stages': stages,
+        'saturation_cameras': find_saturation(stages)
+    }
+
+def print_report(report, json_path=None):
+    """Print a load test report as a table and optionally write it as JSON"""
+    header = f"{'cameras':>7}  {'endpoint':<15} {'reqs':>6} {'err%':>6} {'rps':>8} {'ok p50':>8} {'ok p95':>8} {'ok p99':>8} {'ok max':>8}"
+    print(f"Target: {report['target']}")
+    print("Latency columns cover successful requests only")
+    print(header)
+    print('-' * len(header))
+    for stage in report['stages']:
+        for name, stats in sorted(stage['endpoints'].items()):
+            print(f"{stage['cameras']:>7}  {name:<15} {stats['requests']:>6} "
+                  f"{stats['error_rate'] * 100:>6.1f} {stats['throughput_rps']:>8.2f} "
+                  f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['max_ms']:>8.1f}")
+            if stats['error_breakdown']:
+                breakdown = ', '.join(f"{error}: {count}" for error, count in sorted(stats['error_breakdown'].items()))
+                print(f"{'':>7}  {'':<15} errors -> {breakdown} (slowest {stats['error_max_ms']:.1f} ms)")
+
+    if report['saturation_cameras'] is not None:
+        print(f"process_image throughput plateaued at {report['saturation_cameras']} cameras")
+    else:
+        print("process_image throughput did not plateau within the tested range")
+    if 'telegram' in report:
+        telegram = report['telegram']
+        print(f"Telegram stand-in: {telegram['messages']} messages, "
+              f"{telegram['failures']}/{telegram['requests']} requests failed")
+
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Wrote load test report to {json_path}")
@@ -0,0 +1,51 @@
+import random
+import time
+import threading
+import logging
+from werkzeug.serving import make_server
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class FaultProfile:
+    """Latency and failure injection shared by the simulated services"""
+
+    def __init__(self, latency=0.0, jitter=0.0, failure_rate=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self):
+        """Sleep for the configured latency plus a random jitter"""
+        with self._lock:
+            extra = self._random.uniform(0, self.jitter) if self.jitter > 0 else 0.0
+        total = self.latency + extra
+        if total > 0:
+            time.sleep(total)
+
+    def should_fail(self):
+        """Return True if the current request should be answered with an error"""
+        if self.failure_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.failure_rate
+
+def start_server(app, host='127.0.0.1', port=0):
+    """
+    Serve a Flask app from a daemon thread
+
+    Args:
+        app: Flask application to serve
+        host: Interface to bind
+        port: Port to bind, 0 picks a free port
+
+    Returns:
+        BaseWSGIServer: Running server, call shutdown() to stop it
+    """
+    server = make_server(host, port, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logger.info(f"Started {app.name} on http://{host}:{server.server_port}")
+    return server
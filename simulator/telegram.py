@@ -0,0 +1,91 @@
+import time
+import threading
+import logging
+from flask import Flask, request, jsonify
+from simulator.server import FaultProfile
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+RETRY_AFTER_SECONDS = 1
+
+def create_telegram_app(latency=0.0, jitter=0.0, failure_rate=0.0, seed=None):
+    """
+    Create a Flask app that mimics the Telegram Bot API
+
+    Accepts any token on `/bot<token>/sendMessage`, `/bot<token>/sendPhoto` and
+    `/bot<token>/getMe`. Failed requests are answered like Telegram rate limits
+    (HTTP 429 with `retry_after`). Received messages can be inspected on `/messages`.
+    Point the server at it with TELEGRAM_API_URL=http://<host>:<port>.
+
+    Args:
+        latency: Base response delay in seconds
+        jitter: Maximum extra random delay in seconds
+        failure_rate: Probability (0-1) that a request returns 429
+        seed: Optional random seed for reproducible runs
+
+    Returns:
+        Flask: The simulated Telegram application
+    """
+    app = Flask(__name__)
+    faults = FaultProfile(latency, jitter, failure_rate, seed)
+    lock = threading.Lock()
+    messages = []
+    stats = {'requests': 0, 'failures': 0}
+    app.config['TELEGRAM_MESSAGES'] = messages
+    app.config['TELEGRAM_STATS'] = stats
+
+    def ok(result):
+        return jsonify({'ok': True, 'result': result})
+
+    def record(chat_id, text, photo_size=None):
+        with lock:
+            message = {
+                'message_id': len(messages) + 1,
+                'date': int(time.time()),
+                'chat': {'id': chat_id},
+                'text': text,
+                'photo_size': photo_size
+            }
+            messages.append(message)
+        return message
+
+    @app.route('/messages', methods=['GET'])
+    def list_messages():
+        """Return the messages received so far"""
+        with lock:
+            return jsonify({'count': len(messages), 'stats': dict(stats), 'messages': list(messages)})
+
+    @app.route('/bot<token>/<method>', methods=['GET', 'POST'])
+    def bot_method(token, method):
+        """Dispatch a Bot API method call"""
+        faults.delay()
+        with lock:
+            stats['requests'] += 1
+        if faults.should_fail():
+            with lock:
+                stats['failures'] += 1
+            return jsonify({
+                'ok': False,
+                'error_code': 429,
+                'description': f"Too Many Requests: retry after {RETRY_AFTER_SECONDS}",
+                'parameters': {'retry_after': RETRY_AFTER_SECONDS}
+            }), 429
+
+        chat_id = request.values.get('chat_id')
+        if method == 'getMe':
+            return ok({'id': 1, 'is_bot': True, 'first_name': 'Simulated Bot', 'username': 'sim_bot'})
+        if not chat_id:
+            return jsonify({'ok': False, 'error_code': 400, 'description': 'Bad Request: chat_id is empty'}), 400
+        if method == 'sendMessage':
+            return ok(record(chat_id, request.values.get('text', '')))
+        if method == 'sendPhoto':
+            photo = request.files.get('photo')
+            if photo is None:
+                return jsonify({'ok': False, 'error_code': 400, 'description': 'Bad Request: there is no photo in the request'}), 400
+            return ok(record(chat_id, request.values.get('caption', ''), len(photo.read())))
+
+        logger.warning(f"Unsupported Telegram method: {method}")
+        return jsonify({'ok': False, 'error_code': 404, 'description': 'Not Found: method not found'}), 404
+
+    return app
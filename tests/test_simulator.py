@@ -0,0 +1,158 @@
+import io
+import time
+import requests
+import pytest
+from simulator.esp32cam import create_esp32cam_app
+from simulator.telegram import create_telegram_app, RETRY_AFTER_SECONDS
+from simulator.server import FaultProfile
+from simulator.loadgen import (LatencyRecorder, percentile, find_saturation, timed_request, camera_worker,
+                               SATURATION_GAIN)
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+class FakeSession:
+    """Stands in for requests.Session, returning or raising a fixed outcome"""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def request(self, method, url, **kwargs):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return FakeResponse(self.outcome)
+
+def stage(cameras, rps):
+    return {'cameras': cameras, 'endpoints': {'process_image': {'throughput_rps': rps}}}
+
+def test_percentile_nearest_rank():
+    values = [0.001 * i for i in range(1, 11)]
+    assert percentile(values, 50) == 5.0
+    assert percentile(values, 95) == 10.0
+    assert percentile(values, 99) == 10.0
+    assert percentile(values, 0) == 1.0
+
+def test_percentile_edge_cases():
+    assert percentile([], 50) == 0.0
+    assert percentile([0.25], 1) == 250.0
+    assert percentile([0.25], 100) == 250.0
+
+def test_summary_excludes_failures_from_latency():
+    recorder = LatencyRecorder()
+    recorder.record('process_image', 0.1)
+    recorder.record('process_image', 0.2)
+    recorder.record('process_image', 30.0, 'Timeout')
+    stats = recorder.summary(elapsed=2.0)['process_image']
+    assert stats['requests'] == 3
+    assert stats['errors'] == 1
+    assert stats['error_rate'] == round(1 / 3, 4)
+    assert stats['throughput_rps'] == 1.0
+    assert stats['max_ms'] == 200.0
+    assert stats['p99_ms'] == 200.0
+    assert stats['error_max_ms'] == 30000.0
+    assert stats['error_breakdown'] == {'Timeout': 1}
+
+def test_find_saturation_detects_plateau():
+    stages = [stage(1, 10.0), stage(2, 19.0), stage(4, 19.0 * SATURATION_GAIN - 0.1)]
+    assert find_saturation(stages) == 2
+
+def test_find_saturation_none_while_growing():
+    stages = [stage(1, 10.0), stage(2, 10.0 * SATURATION_GAIN), stage(4, 30.0)]
+    assert find_saturation(stages) is None
+    assert find_saturation([stage(1, 10.0)]) is None
+    assert find_saturation([]) is None
+
+@pytest.mark.parametrize('outcome, expected', [
+    (200, None),
+    (503, 'HTTP 503'),
+    (requests.exceptions.ReadTimeout(), 'Timeout'),
+    (requests.exceptions.ConnectionError(), 'ConnectionError'),
+    (requests.exceptions.TooManyRedirects(), 'TooManyRedirects'),
+])
+def test_timed_request_classifies_outcome(outcome, expected):
+    recorder = LatencyRecorder()
+    response = timed_request(FakeSession(outcome), recorder, 'status', 'GET', 'http://sim/')
+    stats = recorder.summary(elapsed=1.0)['status']
+    assert (response is not None) == (expected is None)
+    assert stats['error_breakdown'] == ({expected: 1} if expected else {})
+
+def test_fault_profile_seeded_failure_rate():
+    first = FaultProfile(failure_rate=0.3, seed=42)
+    second = FaultProfile(failure_rate=0.3, seed=42)
+    outcomes = [first.should_fail() for _ in range(1000)]
+    assert outcomes == [second.should_fail() for _ in range(1000)]
+    assert 200 < sum(outcomes) < 400
+    assert not any(FaultProfile(failure_rate=0.0).should_fail() for _ in range(100))
+    assert all(FaultProfile(failure_rate=1.0).should_fail() for _ in range(100))
+
+def test_telegram_send_message_recorded():
+    app = create_telegram_app()
+    client = app.test_client()
+    response = client.post('/botTOKEN/sendMessage', data={'chat_id': '1', 'text': 'hello'})
+    assert response.status_code == 200
+    assert response.json['ok'] is True
+    assert client.get('/messages').json['messages'][0]['text'] == 'hello'
+
+def test_telegram_send_photo_records_size():
+    client = create_telegram_app().test_client()
+    response = client.post('/botTOKEN/sendPhoto',
+                           data={'chat_id': '1', 'caption': 'face', 'photo': (io.BytesIO(b'jpeg'), 'a.jpg')})
+    assert response.status_code == 200
+    assert response.json['result']['photo_size'] == 4
+
+def test_telegram_missing_chat_id_or_photo():
+    client = create_telegram_app().test_client()
+    assert client.post('/botTOKEN/sendMessage', data={'text': 'hi'}).status_code == 400
+    response = client.post('/botTOKEN/sendPhoto', data={'chat_id': '1'})
+    assert response.status_code == 400
+    assert response.json['ok'] is False
+
+def test_telegram_failure_returns_retry_after():
+    app = create_telegram_app(failure_rate=1.0)
+    response = app.test_client().post('/botTOKEN/sendMessage', data={'chat_id': '1', 'text': 'hi'})
+    assert response.status_code == 429
+    assert response.json['parameters']['retry_after'] == RETRY_AFTER_SECONDS
+    assert app.config['TELEGRAM_STATS'] == {'requests': 1, 'failures': 1}
+    assert app.config['TELEGRAM_MESSAGES'] == []
+
+def test_camera_failure_returns_503():
+    client = create_esp32cam_app(failure_rate=1.0).test_client()
+    assert client.get('/capture').status_code == 503
+
+def test_camera_capture_and_control():
+    client = create_esp32cam_app().test_client()
+    assert client.get('/capture').data[:2] == b'\xff\xd8'
+    assert client.get('/').json['motion_count'] == 1
+    assert client.get('/control?cmd=buzzer&duration=3000').data == b'OK'
+    assert client.get('/').json['buzzer'] is True
+    assert client.get('/control?cmd=unknown').status_code == 400
+
+def test_camera_stream_released_on_disconnect_and_stop():
+    app = create_esp32cam_app(fps=100)
+    client = app.test_client()
+    first = iter(client.get('/stream').response)
+    second = iter(client.get('/stream').response)
+    assert next(first).startswith(b'--frame')
+    next(second)
+    assert client.get('/').json['streaming'] is True
+
+    second.close()
+    assert app.config['CAMERA_STATE']['active_streams'] == 1
+
+    client.get('/control?cmd=stopstream')
+    assert list(first) == []
+    assert client.get('/').json['streaming'] is False
+
+def test_camera_rejects_non_positive_fps():
+    with pytest.raises(ValueError):
+        create_esp32cam_app(fps=0)
+
+def test_camera_worker_pauses_after_failed_capture():
+    recorder = LatencyRecorder()
+    camera_worker(recorder, 'http://127.0.0.1:9', 'http://127.0.0.1:9', time.time() + 0.5,
+                  timeout=0.2, status_interval=None, think_time=0.0, retry_delay=0.2)
+    stats = recorder.summary(elapsed=0.5)
+    assert 'process_image' not in stats
+    assert 1 <= stats['camera_capture']['requests'] <= 3
+    assert stats['camera_capture']['error_breakdown'] == {'ConnectionError': stats['camera_capture']['requests']}
@@ -10,6 +10,8 @@ load_dotenv()
 # Configure logging
 logger = logging.getLogger(__name__)
 
+TELEGRAM_TIMEOUT = 15
+
 def send_telegram_notification(message, image_path=None):
     """
     Send a notification message to Telegram
@@ -29,7 +31,8 @@ def send_telegram_notification(message, image_path=None):
         return False
     
     try:
-        base_url = f"https://api.telegram.org/bot{token}/"
+        api_url = os.getenv('TELEGRAM_API_URL', 'https://api.telegram.org').rstrip('/')
+        base_url = f"{api_url}/bot{token}/"
         
         if image_path and os.path.exists(image_path):
             # Send photo with caption
@@ -37,13 +40,15 @@ def send_telegram_notification(message, image_path=None):
                 response = requests.post(
                     f"{base_url}sendPhoto",
                     data={'chat_id': chat_id, 'caption': message, 'parse_mode': 'HTML'},
-                    files={'photo': photo}
+                    files={'photo': photo},
+                    timeout=TELEGRAM_TIMEOUT
                 )
         else:
             # Send text message
             response = requests.post(
                 f"{base_url}sendMessage",
-                data={'chat_id': chat_id, 'text': message, 'parse_mode': 'HTML'}
+                data={'chat_id': chat_id, 'text': message, 'parse_mode': 'HTML'},
+                timeout=TELEGRAM_TIMEOUT
             )
         
         if response.status_code == 200: